@@ -13,14 +13,17 @@ Features:
 
 import os
 import sys
-import feedparser
-import requests
+import json
+import html
+import tempfile
 import argparse
-from urllib.parse import urlparse
+from urllib.parse import urlparse, urljoin
+from xml.etree import ElementTree
+from email.utils import formatdate
 from datetime import datetime
 from pathlib import Path
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import threading
 import subprocess
 import shutil
@@ -31,12 +34,200 @@ except ImportError:
     unidecode = None
 
 
+# Sent with every feed and episode request
+USER_AGENT = "podcast-downloader/1.0.0"
+
+# Sidecar file (in the output directory) holding feed validators and cached entries
+FEED_CACHE_FILE = ".feed_cache.json"
+
+# Sidecar file (in the output directory) listing already downloaded episodes, per podcast
+DOWNLOADED_INDEX_FILE = ".downloaded.json"
+
+# iTunes namespace, for <itunes:summary> when an item has no <description>
+ITUNES_NS = "{http://www.itunes.com/dtds/podcast-1.0.dtd}"
+
+# Entry fields kept in the feed cache (everything the downloader reads)
+CACHED_ENTRY_KEYS = ('id', 'link', 'title', 'published', 'summary', 'links')
+
+
+# Characters not allowed in filenames on common filesystems, and whitespace runs
+_FS_FORBIDDEN = str.maketrans('', '', '\\/:*?"<>|')
+_RE_WS = re.compile(r'\s+')
+
+# HTML tags stripped from episode descriptions in the index (save_index)
+_RE_HTML = re.compile(r'<[^>]+>')
+
+# Title cleaning (TitleShortener._clean_title)
+_RE_NONWORD = re.compile(r'[^\w\s-]')
+_RE_MULTI_US = re.compile(r'_+')
+_RE_WS_US = re.compile(r'[\s_]+')
+# ASCII equivalent of _RE_NONWORD removal + _RE_WS replacement, as a translate table.
+# Every code point has an entry: misses make str.translate take a slow exception path.
+_CLEAN_TABLE = {
+    i: chr(i) if chr(i).isalnum() or chr(i) in '_-' else ('_' if chr(i).isspace() else None)
+    for i in range(128)
+}
+# Titles that _clean_title would only turn into "Words_Like_This"
+_RE_PLAIN_TITLE = re.compile(r'[A-Za-z0-9-]+(?: [A-Za-z0-9-]+)*')
+
+# Mode open() gives new files (mkstemp always creates them 0600); read once,
+# since os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def sanitize_filename(title):
+    """Strip filesystem-forbidden characters and replace whitespace with underscores."""
+    # Edge whitespace becomes '_' as well; podcast folder names depend on it
+    return _RE_WS.sub('_', title.translate(_FS_FORBIDDEN)).strip()
+
+
+def episode_key(episode):
+    """Stable identifier for an episode: its guid, falling back to link or title."""
+    return (episode.get('id') or episode.get('guid') or episode.get('link')
+            or episode.get('title', ''))
+
+
+def find_audio_enclosure(episode):
+    """Return the first audio enclosure of a feed entry, or None."""
+    # feedparser lists enclosures separately; fall back to all links (e.g. cached entries)
+    candidates = episode.get('enclosures') or episode.get('links', ())
+    return next(
+        (link for link in candidates if (link.get('type') or '').startswith('audio/')), None
+    )
+
+
+def parse_rss_head(chunks, max_entries, base_url='', received=None):
+    """Incrementally parse the channel title and first max_entries items of an RSS 2.0 feed.
+
+    Reading stops as soon as enough items and the channel title have been
+    seen (RSS allows the title after the items), so long back catalogs are
+    neither fully downloaded nor held in memory. Entries carry
+    the feedparser fields the downloader uses (title, published, summary,
+    id, link, links, enclosures).
+
+    Args:
+        chunks: Iterable of raw feed bytes
+        max_entries: Number of items to collect
+        base_url: URL the feed was fetched from, for relative links
+        received: Optional list every chunk read is appended to
+
+    Returns:
+        A feedparser.FeedParserDict, or None if the document is not plain
+        RSS 2.0 or is not well-formed XML (the caller then falls back to
+        feedparser on the full body).
+    """
+    from feedparser import FeedParserDict
+
+    parser = ElementTree.XMLPullParser(events=('start', 'end'))
+    path = []  # tags of the currently open elements
+    feed = FeedParserDict()
+    entries = []
+    truncated = False
+    try:
+        for chunk in chunks:
+            if received is not None:
+                received.append(chunk)
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == 'start':
+                    if not path and elem.tag != 'rss':
+                        return None  # Atom, RSS 1.0 (RDF), ...
+                    path.append(elem.tag)
+                    continue
+                path.pop()
+                if path[-1:] != ['channel']:
+                    continue
+                if elem.tag == 'title':
+                    feed['title'] = (elem.text or '').strip()
+                elif elem.tag == 'link':
+                    feed['link'] = (elem.text or '').strip()
+                elif elem.tag == 'item':
+                    if len(entries) < max_entries:
+                        entries.append(_rss_item_to_entry(elem, base_url, FeedParserDict))
+                    else:
+                        truncated = True  # still looking for the title
+                    elem.clear()
+            if len(entries) >= max_entries and 'title' in feed:
+                truncated = True
+                break
+        else:
+            parser.close()
+    except ElementTree.ParseError:
+        return None
+    if not truncated and 'title' not in feed and not entries:
+        return None  # empty body, or no <channel>
+    return FeedParserDict(feed=feed, entries=entries, bozo=False, truncated=truncated)
+
+
+def _rss_item_to_entry(item, base_url, entry_type):
+    """Map an RSS <item> element to feedparser's entry fields."""
+    entry = entry_type()
+    for key, tag in (('title', 'title'), ('published', 'pubDate'), ('id', 'guid')):
+        text = item.findtext(tag)
+        if text is not None:
+            entry[key] = text.strip()
+    summary = item.findtext('description')
+    if summary is None:
+        summary = item.findtext(ITUNES_NS + 'summary')
+    if summary is not None:
+        entry['summary'] = summary.strip()
+
+    links = []
+    link = (item.findtext('link') or '').strip()
+    if link:
+        entry['link'] = urljoin(base_url, link)
+        links.append(entry_type(rel='alternate', type='text/html', href=entry['link']))
+    enclosures = [
+        entry_type(href=urljoin(base_url, enc.get('url', '')), type=enc.get('type', ''),
+                   length=enc.get('length', ''))
+        for enc in item.iter('enclosure') if enc.get('url')
+    ]
+    links.extend(entry_type(rel='enclosure', **enc) for enc in enclosures)
+    entry['links'] = links
+    entry['enclosures'] = enclosures
+    return entry
+
+
+def atomic_write_text(path, content):
+    """Write text to path atomically (temp file in the same directory + rename)."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(content)
+        os.chmod(tmp_path, _NEW_FILE_MODE)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def drop_page_cache(path):
+    """Tell the kernel a written file won't be read back (no-op where unsupported)."""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def check_ffmpeg():
     """Check if ffmpeg is available on the system."""
     return shutil.which('ffmpeg') is not None
 
 
-def convert_audio(input_path, output_path, mono=True, bitrate=64, sample_rate=22050, joint_stereo=False):
+def convert_audio(input_path, output_path, mono=True, bitrate=64, sample_rate=22050,
+                  joint_stereo=False, compression_level=None):
     """
     Convert audio file using ffmpeg.
 
@@ -47,6 +238,8 @@ def convert_audio(input_path, output_path, mono=True, bitrate=64, sample_rate=22
         bitrate: Target bitrate in kbps (default: 64)
         sample_rate: Target sample rate in Hz (default: 22050)
         joint_stereo: Use joint stereo mode (default: False)
+        compression_level: LAME algorithm quality, 0 (best, slowest) to 9 (fastest)
+            (default: None = encoder default)
 
     Returns:
         True if conversion successful, False otherwise
@@ -59,8 +252,10 @@ def convert_audio(input_path, output_path, mono=True, bitrate=64, sample_rate=22
     elif mono:
         cmd.extend(['-ac', '1'])
 
-    # Bitrate
-    cmd.extend(['-b:a', f'{bitrate}k'])
+    # Encoder and bitrate
+    cmd.extend(['-c:a', 'libmp3lame', '-b:a', f'{bitrate}k'])
+    if compression_level is not None:
+        cmd.extend(['-compression_level', str(compression_level)])
 
     # Sample rate
     cmd.extend(['-ar', str(sample_rate)])
@@ -69,10 +264,11 @@ def convert_audio(input_path, output_path, mono=True, bitrate=64, sample_rate=22
     cmd.extend(['-f', 'mp3', str(output_path)])
 
     try:
+        # Only the exit status is used: discard ffmpeg's log instead of buffering it
         result = subprocess.run(
             cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=300  # 5 min timeout per file
         )
         return result.returncode == 0
@@ -83,7 +279,7 @@ def convert_audio(input_path, output_path, mono=True, bitrate=64, sample_rate=22
 
 
 # Stop words to remove when shortening titles (multilingual)
-STOP_WORDS = {
+STOP_WORDS = frozenset({
     # French
     'le', 'la', 'les', 'de', 'du', 'des', 'un', 'une', 'et', 'en', 'au', 'aux',
     'ce', 'cette', 'ces', 'son', 'sa', 'ses', 'mon', 'ma', 'mes', 'ton', 'ta',
@@ -94,7 +290,7 @@ STOP_WORDS = {
     'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
     'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
     'this', 'that', 'these', 'those', 'it', 'its',
-}
+})
 
 
 class TitleShortener:
@@ -119,6 +315,10 @@ class TitleShortener:
         if available <= 0:
             return ""
 
+        # Fast path: short plain ASCII titles only need spaces -> underscores
+        if len(title) <= available and _RE_PLAIN_TITLE.fullmatch(title):
+            return title.replace(' ', '_')
+
         # Clean the title first
         cleaned = self._clean_title(title)
 
@@ -146,28 +346,24 @@ class TitleShortener:
 
     def _clean_title(self, title):
         """Clean title: remove special chars, normalize spaces."""
-        # Convert accented chars to ASCII if unidecode is available
-        if unidecode:
+        # Convert accented chars to ASCII if unidecode is available (ASCII titles need nothing)
+        if unidecode and not title.isascii():
             title = unidecode(title)
 
-        # Remove special characters but keep alphanumeric and spaces
-        cleaned = re.sub(r'[^\w\s-]', '', title)
-        # Replace whitespace with underscores
-        cleaned = re.sub(r'\s+', '_', cleaned).strip('_')
-        # Remove multiple underscores
-        cleaned = re.sub(r'_+', '_', cleaned)
-        return cleaned
+        if title.isascii():
+            # One C-level pass: drop special characters, whitespace -> underscore
+            cleaned = _RE_MULTI_US.sub('_', title.translate(_CLEAN_TABLE))
+        else:
+            # Remove special characters but keep (Unicode) alphanumerics and spaces,
+            # then turn each run of whitespace/underscores into a single underscore
+            cleaned = _RE_WS_US.sub('_', _RE_NONWORD.sub('', title))
+        return cleaned.strip('_')
 
     def _remove_stop_words(self, title):
         """Remove stop words from title."""
-        words = title.split('_')
-        filtered = []
-        for word in words:
-            word_lower = word.lower()
-            # Keep numbers and non-stop words
-            if word_lower not in STOP_WORDS or word.isdigit():
-                filtered.append(word)
-        return '_'.join(filtered) if filtered else title
+        # Numbers are never stop words, so they are kept as well
+        filtered = '_'.join([word for word in title.split('_') if word.lower() not in STOP_WORDS])
+        return filtered or title
 
     def _abbreviate_words(self, title, min_word_length=6, keep_chars=4):
         """Abbreviate words longer than min_word_length."""
@@ -203,7 +399,8 @@ class TitleShortener:
 
 class PodcastDownloader:
     def __init__(self, feed_url, max_episodes=30, output_dir=".", max_filename_length=None, parallel=2,
-                 convert=False, mono=True, bitrate=64, sample_rate=22050, joint_stereo=False):
+                 convert=False, mono=True, bitrate=64, sample_rate=22050, joint_stereo=False,
+                 refresh=False, compression_level=None):
         """
         Initialize the downloader.
 
@@ -218,14 +415,26 @@ class PodcastDownloader:
             bitrate: Target bitrate in kbps when converting (default: 64)
             sample_rate: Target sample rate in Hz when converting (default: 22050)
             joint_stereo: Use joint stereo mode for compatibility (default: False)
+            refresh: Re-check existing episodes with the server (If-Modified-Since)
+                and re-download those that changed (default: False)
+            compression_level: LAME quality when converting, 0 (best) to 9 (fastest)
+                (default: None = encoder default)
         """
         self.feed_url = feed_url
         self.max_episodes = max_episodes
         self.output_dir = Path(output_dir).resolve()
         self.max_filename_length = max_filename_length
         self.parallel = max(1, parallel)
+        self.refresh = refresh
         self.feed_data = None
+        self.episodes = []
+        self._podcast_name = None
         self.podcast_dir = None
+        self._existing_files = {}  # folder -> set of filenames, see _snapshot_folders
+        self._etags = {}  # audio URL -> ETag of the copy on disk, from .downloaded.json
+        self._partials = {}  # audio URL -> If-Range validator of its .part file, likewise
+        self._convert_pool = None  # set by download_episodes when converting
+        self._conversions = {}  # index -> conversion future queued by download_episode
         self.shortener = TitleShortener(max_filename_length) if max_filename_length else None
 
         # Audio conversion settings
@@ -234,17 +443,27 @@ class PodcastDownloader:
         self.bitrate = bitrate
         self.sample_rate = sample_rate
         self.joint_stereo = joint_stereo
+        self.compression_level = compression_level
 
         if self.convert and not check_ffmpeg():
             print("Warning: ffmpeg not found. Audio conversion disabled.")
             self.convert = False
 
-        # Create a session for connection pooling (faster repeated requests)
+        # Imported here so `--help` and the pure-Python helpers don't pay for them
+        import requests
+        from urllib3.util.retry import Retry
+
+        # Create a session for connection pooling (faster repeated requests).
+        # Enclosures often redirect through tracking hosts to a CDN, so keep pools
+        # for several hosts and enough idle connections per host for every worker.
         self.session = requests.Session()
+        self.session.headers['User-Agent'] = USER_AGENT
         adapter = requests.adapters.HTTPAdapter(
-            pool_connections=self.parallel,
-            pool_maxsize=self.parallel * 2,
-            max_retries=3
+            pool_connections=max(10, self.parallel * 2),
+            pool_maxsize=max(10, self.parallel * 2),
+            max_retries=Retry(
+                total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504]
+            )
         )
         self.session.mount('http://', adapter)
         self.session.mount('https://', adapter)
@@ -252,23 +471,157 @@ class PodcastDownloader:
         # Thread-safe print lock
         self._print_lock = threading.Lock()
 
+    def _load_feed_cache(self):
+        """Return the cached validators/entries for this feed, or None."""
+        try:
+            with open(self.output_dir / FEED_CACHE_FILE, encoding='utf-8') as f:
+                cache = json.load(f).get(self.feed_url)
+        except (OSError, ValueError, AttributeError):
+            return None
+
+        # A cache holding fewer entries than requested can't answer a 304
+        if not cache:
+            return None
+        if not (cache.get('complete') or len(cache.get('entries', [])) >= self.max_episodes):
+            return None
+        return cache
+
+    def _save_feed_cache(self, etag, modified):
+        """Persist the feed validators and the entries we need for the next run."""
+        cache_path = self.output_dir / FEED_CACHE_FILE
+        try:
+            with open(cache_path, encoding='utf-8') as f:
+                caches = json.load(f)
+            if not isinstance(caches, dict):
+                caches = {}
+        except (OSError, ValueError):
+            caches = {}
+
+        entries = self.feed_data.entries
+        title = self.feed_data.feed.get('title')
+        caches[self.feed_url] = {
+            'etag': etag,
+            'modified': modified,
+            # No 'title' key for untitled feeds, so .get('title', default) still applies
+            'feed': {'title': title} if title is not None else {},
+            'entries': [
+                {key: entry[key] for key in CACHED_ENTRY_KEYS if key in entry}
+                for entry in entries[:self.max_episodes]
+            ],
+            'complete': len(entries) <= self.max_episodes and not self.feed_data.get('truncated'),
+        }
+
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(cache_path, json.dumps(caches))
+        except OSError as e:
+            print(f"Warning: Could not write feed cache: {e}")
+
     def fetch_feed(self):
-        """Fetch and parse the RSS feed."""
+        """Fetch and parse the RSS feed (conditional GET when validators are cached)."""
+        import feedparser
+
         print(f"Fetching feed from {self.feed_url}...")
+        self._podcast_name = None
+        cache = self._load_feed_cache()
+        etag = modified = None
         try:
-            self.feed_data = feedparser.parse(self.feed_url)
-            if self.feed_data.bozo:
-                print(f"Warning: Feed parsing issues detected: {self.feed_data.bozo_exception}")
-            return True
+            if urlparse(self.feed_url).scheme in ('http', 'https'):
+                headers = {}
+                if cache and cache.get('etag'):
+                    headers['If-None-Match'] = cache['etag']
+                if cache and cache.get('modified'):
+                    headers['If-Modified-Since'] = cache['modified']
+
+                # Fetch through the shared session (keep-alive, retries, timeouts)
+                with self.session.get(
+                    self.feed_url, headers=headers, timeout=(10, 60), stream=True
+                ) as response:
+                    if cache and response.status_code == 304:
+                        print("Feed not modified since last run, using cached episodes.")
+                        # Caches from older runs may hold 'title': None
+                        feed = {k: v for k, v in cache.get('feed', {}).items() if v is not None}
+                        self.feed_data = feedparser.FeedParserDict(
+                            feed=feedparser.FeedParserDict(feed),
+                            entries=[
+                                feedparser.FeedParserDict(entry)
+                                for entry in cache.get('entries', [])
+                            ],
+                            bozo=False,
+                        )
+                        self._select_episodes()
+                        return True
+                    response.raise_for_status()
+                    etag = response.headers.get('ETag')
+                    modified = response.headers.get('Last-Modified')
+
+                    # Plain RSS: stop reading once max_episodes items have arrived
+                    chunks = response.iter_content(chunk_size=1 << 16)
+                    received = []
+                    self.feed_data = parse_rss_head(
+                        chunks, self.max_episodes, response.url, received
+                    )
+                    if self.feed_data is None:
+                        # Anything else goes to feedparser, with the headers for charset and
+                        # relative links
+                        response_headers = {
+                            key.lower(): value for key, value in response.headers.items()
+                        }
+                        response_headers['content-location'] = response.url
+                        received.extend(chunks)
+                        self.feed_data = feedparser.parse(
+                            b''.join(received), response_headers=response_headers
+                        )
+            elif os.path.isfile(self.feed_url):
+                # Local file: same RSS fast path, reading only as far as needed
+                with open(self.feed_url, 'rb') as f:
+                    chunks = iter(lambda: f.read(1 << 16), b'')
+                    received = []
+                    self.feed_data = parse_rss_head(chunks, self.max_episodes, '', received)
+                    if self.feed_data is None:
+                        received.extend(chunks)
+                        self.feed_data = feedparser.parse(b''.join(received))
+            else:
+                # Other schemes: let feedparser read them directly
+                self.feed_data = feedparser.parse(self.feed_url)
         except Exception as e:
             print(f"Error fetching feed: {e}")
             return False
 
+        if self.feed_data.bozo:
+            print(f"Warning: Feed parsing issues detected: {self.feed_data.bozo_exception}")
+
+        if (etag or modified) and self.feed_data.entries:
+            self._save_feed_cache(etag, modified)
+        self._select_episodes()
+        return True
+
+    def _select_episodes(self):
+        """Pick the episodes to process, oldest first.
+
+        RSS feeds typically list episodes newest first; reversing the latest
+        max_episodes makes index 1 the oldest (for chronological ordering).
+        Shared by download_episodes and save_index so both see the same list.
+        """
+        self.episodes = self.feed_data.entries[:self.max_episodes][::-1]
+
+    def _ensure_episodes(self):
+        """Select the episodes when feed_data was assigned directly instead of by fetch_feed."""
+        if self.feed_data and not self.episodes:
+            self._select_episodes()
+
     def get_podcast_name(self):
         """Extract a safe podcast name from the feed, respecting max_filename_length."""
         if not self.feed_data:
             return "podcast"
 
+        # Computed once per fetched feed (fetch_feed resets it)
+        if self._podcast_name is None:
+            self._podcast_name = self._compute_podcast_name()
+        return self._podcast_name
+
+    def _compute_podcast_name(self):
+        """Clean (and shorten) the feed title into a folder name."""
         # Try to get the title from various sources
         title = self.feed_data.feed.get('title', 'podcast')
 
@@ -288,18 +641,57 @@ class PodcastDownloader:
             return safe_name
         else:
             # Default: clean but don't limit length
-            safe_name = re.sub(r'[\\/:*?"<>|]', '', title)
-            safe_name = re.sub(r'\s+', '_', safe_name).strip()
-            safe_name = safe_name[:100]
+            safe_name = sanitize_filename(title)[:100]
             return safe_name
 
     def create_podcast_directory(self):
         """Create the directory for this podcast (called after knowing episode count)."""
-        # podcast_dir is set dynamically per batch in download_episode
-        # This just stores the base podcast name
+        # Episode folders are chosen per batch in download_episode; podcast_dir
+        # is the first of them (the one holding index.md)
         self.podcast_name = self.get_podcast_name()
+        self._ensure_episodes()
+        self.podcast_dir = self._get_batch_folder(1, len(self.episodes))
+        self.podcast_dir.mkdir(parents=True, exist_ok=True)
         print(f"Podcast: {self.podcast_name}")
 
+    def load_downloaded_items(self):
+        """
+        Load this podcast's already downloaded episodes from the sidecar index.
+
+        The index lives in the output directory, keyed by podcast name, so it
+        neither adds a folder next to the batch folders nor moves when the
+        episodes are split into batches.
+
+        Returns:
+            Dict mapping episode key (see episode_key) to its recorded
+            title, folder, filename, published date, enclosure URL and ETag
+        """
+        items = self._load_downloaded_index().get(self.podcast_name)
+        return items if isinstance(items, dict) else {}
+
+    def save_downloaded_items(self, downloaded_items):
+        """Write the downloaded episodes (see load_downloaded_items) to the sidecar index."""
+        index_path = self.output_dir / DOWNLOADED_INDEX_FILE
+        podcasts = self._load_downloaded_index()
+        podcasts[self.podcast_name] = downloaded_items
+        try:
+            atomic_write_text(index_path, json.dumps(podcasts, ensure_ascii=False, sort_keys=True))
+        except OSError as e:
+            print(f"Warning: Could not write {index_path.name}: {e}")
+
+    def _load_downloaded_index(self):
+        """Read the whole sidecar index (podcast name -> downloaded episodes)."""
+        index_path = self.output_dir / DOWNLOADED_INDEX_FILE
+        try:
+            with open(index_path, encoding='utf-8') as f:
+                podcasts = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read {index_path.name}: {e}")
+            return {}
+        return podcasts if isinstance(podcasts, dict) else {}
+
     def _get_batch_folder(self, index, total_count):
         """
         Get the folder path for an episode based on batching.
@@ -317,8 +709,18 @@ class PodcastDownloader:
 
         return self.output_dir / folder_name
 
-    def save_index(self, total_count):
-        """Create an index.md file mapping shortened filenames to original metadata."""
+    def save_index(self, total_count, filenames=None):
+        """
+        Create an index.md file mapping shortened filenames to original metadata.
+
+        Args:
+            total_count: Number of episodes being processed
+            filenames: Episode filenames in episode order, as planned by
+                download_episodes (computed here when omitted)
+        """
+        self._ensure_episodes()
+        if filenames is None:
+            filenames = self._plan_filenames(total_count)
         folder = self._get_batch_folder(1, total_count)
         index_path = folder / "index.md"
 
@@ -326,51 +728,29 @@ class PodcastDownloader:
         feed = self.feed_data.feed
         title = feed.get('title', 'Unknown Podcast')
 
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        content = f"# {title}\n\n"
-        content += f"**Feed:** {self.feed_url}\n\n"
-        content += f"**Generated:** {now}\n\n"
-
-        # Table header
-        content += "| # | File | Original Title | Description | Date |\n"
-        content += "|---|------|----------------|-------------|------|\n"
+        header = f"# {title}\n\n"
+        header += f"**Feed:** {self.feed_url}\n\n"
 
-        # Get episodes in chronological order
-        episodes = list(reversed(self.feed_data.entries[:self.max_episodes]))
+        # Table header (rows are collected in a list and joined once)
+        rows = [
+            "| # | File | Original Title | Description | Date |\n",
+            "|---|------|----------------|-------------|------|\n",
+        ]
 
-        for i, episode in enumerate(episodes, 1):
+        for i, episode in enumerate(self.episodes, 1):
             episode_title = episode.get('title', 'Untitled')
             published = episode.get('published', '')
             description = episode.get('summary', episode.get('description', ''))
 
             # Clean description for table (remove HTML, truncate)
             if description:
-                description = re.sub(r'<[^>]+>', '', description)  # Remove HTML
-                description = re.sub(r'\s+', ' ', description).strip()  # Normalize whitespace
+                # Remove HTML (tags separate words), decode entities, normalize whitespace
+                description = _RE_HTML.sub(' ', description)
+                description = _RE_WS.sub(' ', html.unescape(description)).strip()
                 if len(description) > 80:
                     description = description[:77] + "..."
 
-            # Generate the filename that would be created
-            batch_folder, display_index = None, i
-            if total_count > 100:
-                batch_num = (i - 1) // 100
-                display_index = (i - 1) % 100
-                index_width = 2
-            else:
-                index_width = self._get_index_width(total_count)
-                display_index = i
-
-            index_str = f"{display_index:0{index_width}d}"
-            prefix = f"{index_str}_"
-
-            if self.shortener:
-                safe_title = self.shortener.shorten(episode_title, prefix_length=len(prefix))
-            else:
-                safe_title = re.sub(r'[\\/:*?"<>|]', '', episode_title)
-                safe_title = re.sub(r'\s+', '_', safe_title).strip()
-
-            filename = f"{prefix}{safe_title}.mp3"
+            filename = filenames[i - 1]
 
             # Parse date to simpler format
             simple_date = published
@@ -386,47 +766,94 @@ class PodcastDownloader:
             episode_title_escaped = episode_title.replace('|', '\\|')
             description_escaped = description.replace('|', '\\|') if description else '-'
 
-            content += f"| {i} | `{filename}` | {episode_title_escaped} | {description_escaped} | {simple_date} |\n"
-
-        # Write to file
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print(f"index.md created at {index_path}")
-
-    def _get_index_width(self, count):
-        """Calculate the minimum width needed for zero-padded indices."""
-        if count <= 9:
-            return 1
-        elif count <= 99:
-            return 2
-        else:
-            return 3
+            rows.append(
+                f"| {i} | `{filename}` | {episode_title_escaped} | {description_escaped}"
+                f" | {simple_date} |\n"
+            )
 
-    def download_episode(self, episode, index, total_count):
-        """Download a single episode."""
-        # Find the MP3 enclosure
-        enclosure = None
-        for link in episode.get('links', []):
-            if link.get('type', '').startswith('audio/'):
-                enclosure = link
-                break
+        content = "".join(rows)
 
-        if not enclosure:
-            print(f"  Skipping: No audio enclosure found")
-            return False
+        # Leave the file (and its mtime) alone when only the timestamp would change
+        try:
+            existing = index_path.read_text(encoding='utf-8')
+        except OSError:
+            existing = ''
+        if existing.startswith(header) and existing[len(header):].partition('\n\n')[2] == content:
+            print(f"index.md unchanged at {index_path}")
+            return
 
-        audio_url = enclosure.get('href')
-        audio_type = enclosure.get('type', 'mp3')
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        folder.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(index_path, f"{header}**Generated:** {now}\n\n{content}")
 
-        # Get episode information
-        title = episode.get('title', f"Episode_{index}")
-        published = episode.get('published', '')
+        print(f"index.md created at {index_path}")
 
-        # Get target folder (may be batched for >100 episodes)
-        target_dir = self._get_batch_folder(index, total_count)
-        target_dir.mkdir(parents=True, exist_ok=True)
+    def _reuse_previous_downloads(self, downloaded_items, filenames, total_count):
+        """
+        Rename episodes downloaded under an older filename instead of fetching them again.
 
+        Filenames change when a title is edited upstream or when new episodes
+        shift the indices. Episodes are matched by key (guid), then by audio URL.
+        """
+        by_url = {item.get('url'): item for item in downloaded_items.values() if item.get('url')}
+
+        for index, episode in enumerate(self.episodes, 1):
+            folder = self._get_batch_folder(index, total_count)
+            filename = filenames[index - 1]
+            if self._file_exists(folder, filename):
+                continue
+
+            item = downloaded_items.get(episode_key(episode))
+            if item is None:
+                enclosure = find_audio_enclosure(episode)
+                item = by_url.get(enclosure.get('href')) if enclosure else None
+            if not item or not item.get('filename'):
+                continue
+
+            old_folder = self.output_dir / item.get('folder', self.podcast_name)
+            if (old_folder, item['filename']) == (folder, filename):
+                continue
+            if not self._file_exists(old_folder, item['filename']):
+                continue
+
+            try:
+                folder.mkdir(parents=True, exist_ok=True)
+                os.replace(old_folder / item['filename'], folder / filename)
+            except OSError as e:
+                print(f"  Warning: Could not rename {item['filename']}: {e}")
+                continue
+
+            print(f"  [{index:02d}] Renamed: {item['filename']} -> {filename}")
+            self._existing_files.setdefault(old_folder, set()).discard(item['filename'])
+            self._existing_files.setdefault(folder, set()).add(filename)
+
+    def _snapshot_folders(self, total_count):
+        """List each batch folder once so existence checks don't stat every episode."""
+        self._existing_files = {}
+        for index in range(1, total_count + 1, 100):
+            folder = self._get_batch_folder(index, total_count)
+            try:
+                with os.scandir(folder) as entries:
+                    self._existing_files[folder] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                self._existing_files[folder] = set()
+
+    def _file_exists(self, folder, filename):
+        """Check a file against the folder snapshot, falling back to the filesystem."""
+        existing = self._existing_files.get(folder)
+        if existing is None:
+            return (folder / filename).exists()
+        return filename in existing
+
+    def _plan_filenames(self, total_count):
+        """Compute every episode's filename once (shared by the downloads and index.md)."""
+        return [
+            self._get_episode_filename(episode.get('title', f"Episode_{i}"), i, total_count)
+            for i, episode in enumerate(self.episodes, 1)
+        ]
+
+    def _get_episode_filename(self, title, index, total_count):
+        """Build the indexed filename for an episode (e.g. "01_Title.mp3")."""
         # Calculate display index within batch
         if total_count <= 100:
             # Single folder: use dynamic width based on count
@@ -446,46 +873,167 @@ class PodcastDownloader:
             safe_title = self.shortener.shorten(title, prefix_length=len(prefix))
         else:
             # Default cleaning without length limit
-            safe_title = re.sub(r'[\\/:*?"<>|]', '', title)
-            safe_title = re.sub(r'\s+', '_', safe_title).strip()
+            safe_title = sanitize_filename(title)
+
+        return f"{prefix}{safe_title}.mp3"
+
+    def _get_index_width(self, count):
+        """Calculate the minimum width needed for zero-padded indices."""
+        return len(str(max(1, count)))
 
-        filename = f"{prefix}{safe_title}.mp3"
+    def download_episode(self, episode, index, total_count, filename=None, enclosure=None):
+        """Download a single episode.
+
+        filename and enclosure are the ones planned by download_episodes, if given.
+        """
+        # Get episode information
+        title = episode.get('title', f"Episode_{index}")
 
+        # Find the MP3 enclosure
+        if enclosure is None:
+            enclosure = find_audio_enclosure(episode)
+
+        if not enclosure:
+            with self._print_lock:
+                print(f"  [{index:02d}] Skipping: {title[:40]}... (no audio enclosure)")
+            return (index, title, False, "no audio enclosure")
+
+        audio_url = enclosure.get('href')
+
+        # Get target folder (may be batched for >100 episodes)
+        target_dir = self._get_batch_folder(index, total_count)
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        if filename is None:
+            filename = self._get_episode_filename(title, index, total_count)
         filepath = target_dir / filename
+        # Bytes are streamed into a .part file that is renamed when complete,
+        # so an existing filepath always means a finished episode
+        part_path = filepath.with_name(filepath.name + '.part')
 
         # Check if already downloaded
-        if filepath.exists():
+        exists = self._file_exists(target_dir, filename)
+        if exists and not self.refresh:
             with self._print_lock:
                 print(f"  [{index:02d}] Skipping: {title[:40]}... (exists)")
             return (index, title, True, "skipped")
 
+        resume_from = 0
+        if not exists and self._file_exists(target_dir, part_path.name):
+            resume_from = part_path.stat().st_size
+
         with self._print_lock:
-            print(f"  [{index:02d}] Downloading: {title[:40]}...")
+            if exists:
+                print(f"  [{index:02d}] Checking: {title[:40]}...")
+            elif resume_from:
+                resume_mb = resume_from / (1024 * 1024)
+                print(f"  [{index:02d}] Resuming: {title[:40]}... (from {resume_mb:.1f} MB)")
+            else:
+                print(f"  [{index:02d}] Downloading: {title[:40]}...")
 
         try:
-            # Stream download using session (connection pooling)
-            response = self.session.get(audio_url, stream=True, timeout=(10, 60))
-            response.raise_for_status()
-
-            total_size = int(response.headers.get('content-length', 0))
+            # Stream download using session (connection pooling); resume a
+            # previous partial download with a Range request. Audio doesn't
+            # compress, and identity keeps Range offsets and ETags in file bytes.
+            headers = {'Accept-Encoding': 'identity'}
+            if exists:
+                headers['If-Modified-Since'] = formatdate(filepath.stat().st_mtime, usegmt=True)
+                if self._etags.get(audio_url):
+                    headers['If-None-Match'] = self._etags[audio_url]
+            elif resume_from:
+                headers['Range'] = f'bytes={resume_from}-'
+                if self._partials.get(audio_url):
+                    # An episode changed since the .part was started comes back whole (200)
+                    headers['If-Range'] = self._partials[audio_url]
+            response = self.session.get(audio_url, headers=headers, stream=True, timeout=(10, 60))
+
+            if exists and response.status_code == 304:
+                response.close()
+                with self._print_lock:
+                    print(f"  [{index:02d}] Skipping: {title[:40]}... (unchanged)")
+                return (index, title, True, "skipped")
+
+            complete = False
+            if resume_from and response.status_code == 416:
+                # Nothing left to fetch if the partial file already has every byte
+                response.close()
+                remote_size = response.headers.get('Content-Range', '').rpartition('/')[2]
+                if remote_size == str(resume_from):
+                    complete = True
+                else:
+                    part_path.unlink()
+                    del headers['Range']
+                    headers.pop('If-Range', None)
+                    response = self.session.get(
+                        audio_url, headers=headers, stream=True, timeout=(10, 60)
+                    )
+            elif resume_from and response.status_code == 206:
+                # Append only if the body starts at our offset ("bytes 1000-1999/2000"):
+                # a server or proxy that ignored it would corrupt the .part file
+                content_range = response.headers.get('Content-Range', '')
+                start = content_range.partition(' ')[2].partition('-')[0]
+                if start != str(resume_from):
+                    response.close()
+                    del headers['Range']
+                    headers.pop('If-Range', None)
+                    response = self.session.get(
+                        audio_url, headers=headers, stream=True, timeout=(10, 60)
+                    )
+
+            if not complete:
+                response.raise_for_status()
+                if response.headers.get('ETag'):
+                    self._etags[audio_url] = response.headers['ETag']
+
+                # 206 to our Range request means the server honoured it; anything else
+                # restarts from zero
+                mode = 'ab' if 'Range' in headers and response.status_code == 206 else 'wb'
+                if mode == 'wb':
+                    # Remember what the new .part holds; If-Range needs a strong ETag
+                    etag = response.headers.get('ETag', '')
+                    self._partials[audio_url] = (
+                        etag if etag and not etag.startswith('W/')
+                        else response.headers.get('Last-Modified')
+                    )
+
+                # Copy the body in C-level 1 MB reads (decode any Content-Encoding),
+                # through a writer buffer of the same size
+                response.raw.decode_content = True
+                with open(part_path, mode, buffering=1 << 20) as f:
+                    shutil.copyfileobj(response.raw, f, length=1 << 20)
+
+            if self._convert_pool is not None:
+                # Convert on the conversion pool so this download slot is freed now
+                self._conversions[index] = self._convert_pool.submit(
+                    self._finish_episode, part_path, filepath, index, title
+                )
+                return (index, title, True, "converting")
+
+            return self._finish_episode(part_path, filepath, index, title)
 
-            with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=65536):  # Larger chunks
-                    if chunk:
-                        f.write(chunk)
+        except Exception as e:
+            # The .part file is kept so the next run can resume it
+            with self._print_lock:
+                print(f"  [{index:02d}] Error: {title[:30]}... - {e}")
+            return (index, title, False, str(e))
 
-            original_size = filepath.stat().st_size
+    def _finish_episode(self, part_path, filepath, index, title):
+        """Convert (if enabled) a fully downloaded .part file and move it into place."""
+        try:
+            original_size = part_path.stat().st_size
 
-            # Convert audio if enabled
+            # Convert audio if enabled (before the rename, so an interrupted
+            # conversion is redone on the next run)
             if self.convert:
                 with self._print_lock:
                     print(f"  [{index:02d}] Converting: {title[:40]}...")
 
                 temp_path = filepath.with_suffix('.tmp.mp3')
-                if convert_audio(filepath, temp_path, self.mono, self.bitrate, self.sample_rate, self.joint_stereo):
+                if convert_audio(part_path, temp_path, self.mono, self.bitrate, self.sample_rate,
+                                 self.joint_stereo, self.compression_level):
                     # Replace original with converted
-                    filepath.unlink()
-                    temp_path.rename(filepath)
+                    os.replace(temp_path, filepath)
+                    part_path.unlink()
                     final_size = filepath.stat().st_size
                     reduction = (1 - final_size / original_size) * 100 if original_size > 0 else 0
                     with self._print_lock:
@@ -495,33 +1043,35 @@ class PodcastDownloader:
                     # Conversion failed, keep original
                     if temp_path.exists():
                         temp_path.unlink()
+                    os.replace(part_path, filepath)
                     with self._print_lock:
                         size_mb = original_size / (1024 * 1024)
                         print(f"  [{index:02d}] Done: {filepath.name} ({size_mb:.1f} MB, conversion failed)")
             else:
+                os.replace(part_path, filepath)
                 with self._print_lock:
                     size_mb = original_size / (1024 * 1024)
                     print(f"  [{index:02d}] Done: {filepath.name} ({size_mb:.1f} MB)")
 
+            # Episodes are never re-read by us; keep them from crowding the page cache
+            drop_page_cache(filepath)
+
             return (index, title, True, "downloaded")
 
         except Exception as e:
+            # The .part file is kept so the next run can finish it
             with self._print_lock:
                 print(f"  [{index:02d}] Error: {title[:30]}... - {e}")
-            if filepath.exists():
-                filepath.unlink()  # Remove partial file
             return (index, title, False, str(e))
 
     def download_episodes(self):
         """Download the latest episodes (parallel or sequential)."""
-        if not self.feed_data or not self.feed_data.entries:
+        self._ensure_episodes()
+        if not self.feed_data or not self.episodes:
             print("No episodes found in feed.")
             return False
 
-        # Get episodes to download (up to max_episodes)
-        # RSS feeds typically return episodes in reverse chronological order (newest first)
-        # We reverse them so index 1 is the oldest episode (for proper chronological ordering)
-        episodes = list(reversed(self.feed_data.entries[:self.max_episodes]))
+        episodes = self.episodes
         total_count = len(episodes)
 
         print(f"\nFound {total_count} episodes in feed.")
@@ -533,37 +1083,107 @@ class PodcastDownloader:
         success_count = 0
         download_count = 0
         skip_count = 0
-
-        # Prepare download tasks: (episode, index, total_count)
-        tasks = [(ep, i, total_count) for i, ep in enumerate(episodes, 1)]
-
-        # Use ThreadPoolExecutor for parallel downloads
-        with ThreadPoolExecutor(max_workers=self.parallel) as executor:
-            # Submit all download tasks
-            futures = {
-                executor.submit(self.download_episode, ep, idx, total): (idx, ep)
-                for ep, idx, total in tasks
-            }
-
-            # Process completed downloads
-            for future in as_completed(futures):
-                idx, ep = futures[future]
+        downloaded_items = self.load_downloaded_items()
+        self._etags = {
+            item['url']: item['etag']
+            for item in downloaded_items.values() if item.get('url') and item.get('etag')
+        }
+        self._partials = {
+            item['part_url']: item['part_validator']
+            for item in downloaded_items.values()
+            if item.get('part_url') and item.get('part_validator')
+        }
+
+        self._snapshot_folders(total_count)
+
+        # Shorten/sanitize every title up front, before the workers start
+        filenames = self._plan_filenames(total_count)
+        self._reuse_previous_downloads(downloaded_items, filenames, total_count)
+
+        # Prepare download tasks: (episode, index, total_count, filename, enclosure)
+        enclosures = [find_audio_enclosure(ep) for ep in episodes]
+        tasks = [
+            (ep, i, total_count, filenames[i - 1], enclosures[i - 1])
+            for i, ep in enumerate(episodes, 1)
+        ]
+        # Dispatch episodes host by host (stable, so oldest first within a host):
+        # consecutive requests to one host reuse its keep-alive connections
+        tasks.sort(key=lambda task: urlparse((task[4] or {}).get('href', '')).netloc)
+
+        # ffmpeg runs as a child process, so threads are enough to convert on every core
+        # while the download workers move on to the next episode
+        self._convert_pool = None
+        if self.convert:
+            self._convert_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        self._conversions = {}
+
+        # Record finished episodes even if the run is interrupted part-way
+        try:
+            # Use ThreadPoolExecutor for parallel downloads (no idle workers for short feeds)
+            with ThreadPoolExecutor(max_workers=min(self.parallel, total_count)) as executor:
+                # Submit all download tasks
+                futures = {
+                    executor.submit(
+                        self.download_episode, ep, idx, total, filename, enclosure
+                    ): (idx, ep)
+                    for ep, idx, total, filename, enclosure in tasks
+                }
+
+                # Process completed downloads (and the conversions they queue)
+                pending = set(futures)
                 try:
-                    result = future.result()
-                    index, title, success, status = result
-                    if success:
-                        success_count += 1
-                        if status == "downloaded":
-                            download_count += 1
-                        elif status == "skipped":
-                            skip_count += 1
-                except Exception as e:
-                    print(f"  Task error: {e}")
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            idx, ep = futures[future]
+                            try:
+                                result = future.result()
+                                index, title, success, status = result
+                                if status == "converting":
+                                    conversion = self._conversions.pop(index)
+                                    futures[conversion] = (idx, ep)
+                                    pending.add(conversion)
+                                    continue
+                                if success:
+                                    success_count += 1
+                                    enclosure = enclosures[idx - 1]
+                                    url = enclosure.get('href') if enclosure else None
+                                    self._partials.pop(url, None)
+                                    downloaded_items[episode_key(ep)] = {
+                                        'title': title,
+                                        'folder': self._get_batch_folder(idx, total_count).name,
+                                        'filename': filenames[idx - 1],
+                                        'published': ep.get('published', ''),
+                                        'url': url,
+                                        'etag': self._etags.get(url),
+                                    }
+                                    if status == "downloaded":
+                                        download_count += 1
+                                    elif status == "skipped":
+                                        skip_count += 1
+                            except Exception as e:
+                                print(f"  Task error: {e}")
+                except KeyboardInterrupt:
+                    # Don't start queued episodes; in-flight ones keep their .part files
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            if self._convert_pool is not None:
+                self._convert_pool.shutdown()
+                self._convert_pool = None
+            # Unfinished episodes keep their .part validator, for If-Range on the next run
+            for ep, enclosure in zip(episodes, enclosures):
+                url = enclosure.get('href') if enclosure else None
+                if url in self._partials:
+                    item = downloaded_items.setdefault(episode_key(ep), {})
+                    item.update(part_url=url, part_validator=self._partials[url])
+            self.save_downloaded_items(downloaded_items)
 
         elapsed = time.time() - start_time
 
         # Generate index file
-        self.save_index(total_count)
+        self.save_index(total_count, filenames)
 
         print(f"\nDownload complete in {elapsed:.1f}s")
         print(f"Downloaded: {download_count}, Skipped: {success_count - download_count}, Failed: {total_count - success_count}")
@@ -575,11 +1195,14 @@ class PodcastDownloader:
         print("Podcast Downloader")
         print("=" * 60)
 
-        if not self.fetch_feed():
-            return False
+        try:
+            if not self.fetch_feed():
+                return False
 
-        self.create_podcast_directory()
-        return self.download_episodes()
+            self.create_podcast_directory()
+            return self.download_episodes()
+        finally:
+            self.session.close()
 
 
 def main():
@@ -608,7 +1231,8 @@ def main():
         help="Maximum filename length for devices with limits (e.g., 27 for Remi babyphone)"
     )
     parser.add_argument(
-        "-p", "--parallel",
+        "-p", "--parallel", "-j", "--jobs",
+        dest="parallel",
         type=int,
         default=2,
         help="Number of parallel downloads (default: 2)"
@@ -642,6 +1266,20 @@ def main():
         default=22050,
         help="Audio sample rate in Hz when converting (default: 22050)"
     )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        choices=range(10),
+        default=None,
+        metavar="0-9",
+        help="LAME quality when converting: 0 = best/slowest, 9 = fastest "
+             "(default: encoder default)"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-check existing episodes with the server and re-download those that changed"
+    )
     parser.add_argument(
         "--stereo",
         action="store_true",
@@ -674,7 +1312,9 @@ def main():
         mono=not args.stereo and not joint_stereo,
         bitrate=args.bitrate,
         sample_rate=args.sample_rate,
-        joint_stereo=joint_stereo
+        joint_stereo=joint_stereo,
+        refresh=args.refresh,
+        compression_level=args.compression_level
     )
 
     success = downloader.run()
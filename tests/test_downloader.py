@@ -1,112 +1,443 @@
 """Tests for the PodcastDownloader class."""
 
+import io
+import os
+import re
+import stat
 import pytest
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from podcast_downloader import PodcastDownloader
+from podcast_downloader import PodcastDownloader, TitleShortener
+from podcast_downloader.downloader import (
+    episode_key,
+    find_audio_enclosure,
+    parse_rss_head,
+    sanitize_filename,
+)
+
+
+@pytest.fixture
+def fake_feed():
+    """Build a minimal stand-in for feedparser's result with the given feed title."""
+    def make(title):
+        return SimpleNamespace(feed={"title": title}, entries=[])
+    return make
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory):
+    """One output directory for tests that never write to it."""
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture(scope="class")
+def prepared_downloader(tmp_path_factory):
+    """A downloader with its podcast directory created, shared by read-only tests."""
+    downloader = PodcastDownloader(
+        feed_url="https://example.com/test.rss",
+        output_dir=str(tmp_path_factory.mktemp("prepared")),
+    )
+    downloader.feed_data = SimpleNamespace(feed={"title": "Test_Podcast"}, entries=[])
+    downloader.create_podcast_directory()
+    return downloader
 
 
 class TestPodcastDownloader:
     """Test suite for PodcastDownloader."""
 
-    def test_init(self, tmp_path):
+    def test_init(self, shared_tmp):
         """Test downloader initialization."""
         downloader = PodcastDownloader(
             feed_url="https://example.com/test.rss",
             max_episodes=5,
-            output_dir=str(tmp_path),
+            output_dir=str(shared_tmp),
         )
         assert downloader.feed_url == "https://example.com/test.rss"
         assert downloader.max_episodes == 5
-        assert downloader.output_dir == tmp_path
+        assert downloader.output_dir == shared_tmp
 
-    def test_get_podcast_name_cleans_special_chars(self, tmp_path):
-        """Test that podcast names are sanitized for filesystem use."""
+    @pytest.mark.parametrize("title, expected", [
+        # Trailing whitespace left by stripped characters stays an underscore:
+        # changing it would move existing podcast folders
+        ('Test Podcast: /\\:*?"<>|', "Test_Podcast_"),
+        ("My Great Podcast", "My_Great_Podcast"),
+    ])
+    def test_get_podcast_name_sanitizes(self, shared_tmp, fake_feed, title, expected):
+        """Test that podcast names lose filesystem-forbidden characters and whitespace."""
         downloader = PodcastDownloader(
             feed_url="https://example.com/test.rss",
-            output_dir=str(tmp_path),
+            output_dir=str(shared_tmp),
         )
-        downloader.feed_data = MagicMock()
-        downloader.feed_data.feed.get.return_value = 'Test Podcast: /\\:*?"<>|'
+        downloader.feed_data = fake_feed(title)
 
         name = downloader.get_podcast_name()
 
-        assert "/" not in name
-        assert "\\" not in name
-        assert ":" not in name
-        assert "*" not in name
-        assert "?" not in name
-        assert '"' not in name
-        assert "<" not in name
-        assert ">" not in name
-        assert "|" not in name
-
-    def test_get_podcast_name_replaces_whitespace(self, tmp_path):
-        """Test that whitespace is replaced with underscores."""
+        assert not set(name) & set('/\\:*?"<>| ')
+        assert name == expected
+
+    def test_create_podcast_directory(self, prepared_downloader):
+        """Test that podcast directory is created."""
+        downloader = prepared_downloader
+
+        assert downloader.podcast_dir.exists()
+        assert downloader.podcast_dir.is_dir()
+        assert downloader.podcast_dir == downloader.output_dir / "Test_Podcast"
+
+    def test_load_downloaded_items_empty(self, prepared_downloader):
+        """Test loading downloaded items when no .downloaded.json exists."""
+        downloader = prepared_downloader
+
+        items = downloader.load_downloaded_items()
+
+        assert items == {}
+
+    def test_downloaded_items_round_trip(self, tmp_path, fake_feed):
+        """Test that downloaded items keyed by guid survive a save/load."""
         downloader = PodcastDownloader(
             feed_url="https://example.com/test.rss",
             output_dir=str(tmp_path),
         )
-        downloader.feed_data = MagicMock()
-        downloader.feed_data.feed.get.return_value = "My Great Podcast"
+        downloader.feed_data = fake_feed("Test_Podcast")
+        downloader.create_podcast_directory()
 
-        name = downloader.get_podcast_name()
+        items = {
+            "guid-1": {"title": "Episode 1", "filename": "1_Episode_1.mp3", "published": ""},
+            "guid-2": {"title": "Episode 1", "filename": "2_Episode_1.mp3", "published": ""},
+        }
+        downloader.save_downloaded_items(items)
 
-        assert " " not in name
-        assert name == "My_Great_Podcast"
+        assert downloader.load_downloaded_items() == items
 
-    def test_create_podcast_directory(self, tmp_path):
-        """Test that podcast directory is created."""
+    def test_batched_podcast_gets_no_extra_folder(self, tmp_path, fake_feed):
+        """Test that over 100 episodes only batch folders are created next to the index."""
         downloader = PodcastDownloader(
             feed_url="https://example.com/test.rss",
             output_dir=str(tmp_path),
         )
-        downloader.feed_data = MagicMock()
-        downloader.feed_data.feed.get.return_value = "Test_Podcast"
+        downloader.feed_data = fake_feed("Big Show")
+        downloader.episodes = [{"id": f"guid-{i}"} for i in range(150)]
+        downloader.create_podcast_directory()
+
+        items = {
+            "guid-0": {
+                "title": "Episode 0", "folder": "0_Big_Show", "filename": "00_Episode_0.mp3",
+            },
+        }
+        downloader.save_downloaded_items(items)
 
+        names = sorted(path.name for path in tmp_path.iterdir())
+        assert names == [".downloaded.json", "0_Big_Show"]
+        assert downloader.load_downloaded_items() == items
+
+    def test_save_index_skips_write_when_only_timestamp_changes(self, tmp_path, fake_feed):
+        """Test that an up-to-date index.md keeps its content, mtime and umask permissions."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+        )
+        downloader.feed_data = fake_feed("Test_Podcast")
         downloader.create_podcast_directory()
+        downloader.episodes = [{"title": "Episode 1", "summary": "<p>First</p>"}]
+        index_path = downloader.podcast_dir / "index.md"
 
-        assert downloader.podcast_dir.exists()
-        assert downloader.podcast_dir.is_dir()
+        downloader.save_index(1)
+        umask = os.umask(0)
+        os.umask(umask)
+        assert stat.S_IMODE(index_path.stat().st_mode) == 0o666 & ~umask
+
+        old = re.sub(
+            r"\*\*Generated:\*\* .*", "**Generated:** 2000-01-01 00:00:00", index_path.read_text()
+        )
+        index_path.write_text(old)
+        os.utime(index_path, (946684800, 946684800))
+        downloader.save_index(1)
+
+        assert index_path.read_text() == old
+        assert index_path.stat().st_mtime == 946684800
+
+    def test_reuse_previous_downloads_renames_shifted_episode(self, tmp_path, fake_feed):
+        """Test that an episode whose index shifted is renamed rather than refetched."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+        )
+        downloader.feed_data = fake_feed("Test_Podcast")
+        downloader.create_podcast_directory()
+        downloader.episodes = [
+            {"id": "guid-0", "title": "Episode 0"},
+            {"id": "guid-1", "title": "Episode 1"},
+        ]
+        (downloader.podcast_dir / "1_Episode_1.mp3").write_bytes(b"audio")
+        downloaded_items = {
+            "guid-1": {
+                "title": "Episode 1", "folder": "Test_Podcast", "filename": "1_Episode_1.mp3",
+            },
+        }
+
+        downloader._snapshot_folders(2)
+        downloader._reuse_previous_downloads(
+            downloaded_items, ["1_Episode_0.mp3", "2_Episode_1.mp3"], 2
+        )
+
+        assert not (downloader.podcast_dir / "1_Episode_1.mp3").exists()
+        assert (downloader.podcast_dir / "2_Episode_1.mp3").read_bytes() == b"audio"
+
+    def test_interrupted_run_keeps_finished_episodes(self, tmp_path, fake_feed):
+        """Test that episodes finished before Ctrl-C are still recorded."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+            parallel=1,
+        )
+        downloader.feed_data = fake_feed("Test_Podcast")
+        downloader.create_podcast_directory()
+        downloader.episodes = [
+            {"id": "guid-0", "title": "Episode 0"},
+            {"id": "guid-1", "title": "Episode 1"},
+        ]
+
+        def fake_download(episode, index, total_count, filename=None, enclosure=None):
+            if index == 2:
+                raise KeyboardInterrupt
+            return (index, episode["title"], True, "downloaded")
+
+        with patch.object(downloader, "download_episode", side_effect=fake_download):
+            with pytest.raises(KeyboardInterrupt):
+                downloader.download_episodes()
+
+        assert list(downloader.load_downloaded_items()) == ["guid-0"]
+
+    def test_download_episodes_selects_episodes_from_assigned_feed(self, tmp_path):
+        """Test that library callers can set feed_data directly instead of fetching."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+        )
+        downloader.feed_data = SimpleNamespace(
+            feed={"title": "Test_Podcast"},
+            entries=[
+                {"id": "guid-1", "title": "Episode 1"},
+                {"id": "guid-0", "title": "Episode 0"},
+            ],
+        )
+        downloader.create_podcast_directory()
+
+        def fake_download(episode, index, total_count, filename=None, enclosure=None):
+            return (index, episode["title"], True, "downloaded")
+
+        with patch.object(downloader, "download_episode", side_effect=fake_download):
+            assert downloader.download_episodes()
+
+        assert sorted(downloader.load_downloaded_items()) == ["guid-0", "guid-1"]
+        assert "`1_Episode_0.mp3`" in (downloader.podcast_dir / "index.md").read_text()
+
+    def test_refresh_sends_stored_etag(self, tmp_path, fake_feed):
+        """Test that --refresh revalidates an existing episode with its recorded ETag."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+            refresh=True,
+        )
+        downloader.feed_data = fake_feed("Test_Podcast")
+        downloader.create_podcast_directory()
+        (downloader.podcast_dir / "1_Episode_1.mp3").write_bytes(b"audio")
+        downloader._snapshot_folders(1)
+        downloader._etags = {"https://example.com/1.mp3": '"v1"'}
+        episode = {
+            "title": "Episode 1",
+            "links": [{"href": "https://example.com/1.mp3", "type": "audio/mpeg"}],
+        }
+
+        not_modified = MagicMock(status_code=304)
+        with patch.object(downloader.session, "get", return_value=not_modified) as get:
+            result = downloader.download_episode(episode, 1, 1, "1_Episode_1.mp3")
+
+        assert result == (1, "Episode 1", True, "skipped")
+        assert get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
 
-    def test_get_readme_path(self, tmp_path):
-        """Test README path generation."""
+    @pytest.mark.parametrize("content_range, body, refetched", [
+        ("bytes 3-4/5", b"LO", False),  # offset honoured: append
+        ("bytes 0-4/5", b"HELLO", True),  # offset ignored: refetch from zero
+    ])
+    def test_resume_checks_content_range_start(
+        self, tmp_path, fake_feed, content_range, body, refetched
+    ):
+        """Test that a 206 is only appended when it starts at the .part size."""
         downloader = PodcastDownloader(
             feed_url="https://example.com/test.rss",
             output_dir=str(tmp_path),
         )
-        downloader.feed_data = MagicMock()
-        downloader.feed_data.feed.get.return_value = "Test_Podcast"
+        downloader.feed_data = fake_feed("Test_Podcast")
         downloader.create_podcast_directory()
+        (downloader.podcast_dir / "1_Episode_1.mp3.part").write_bytes(b"HEL")
+        downloader._snapshot_folders(1)
+        episode = {
+            "title": "Episode 1",
+            "links": [{"href": "https://example.com/1.mp3", "type": "audio/mpeg"}],
+        }
+        partial = MagicMock(status_code=206, headers={"Content-Range": content_range})
+        partial.raw = io.BytesIO(body)
+        full = MagicMock(status_code=200, headers={})
+        full.raw = io.BytesIO(b"HELLO")
 
-        readme_path = downloader.get_readme_path()
+        with patch.object(downloader.session, "get", side_effect=[partial, full]) as get:
+            result = downloader.download_episode(episode, 1, 1, "1_Episode_1.mp3")
 
-        assert readme_path.name == "README.md"
-        assert readme_path.parent == downloader.podcast_dir
+        assert result == (1, "Episode 1", True, "downloaded")
+        assert (downloader.podcast_dir / "1_Episode_1.mp3").read_bytes() == b"HELLO"
+        assert get.call_count == (2 if refetched else 1)
+        assert ("Range" in get.call_args.kwargs["headers"]) is not refetched
 
-    def test_load_downloaded_items_empty(self, tmp_path):
-        """Test loading downloaded items when no README exists."""
+    def test_resume_sends_if_range_and_restarts_changed_episode(self, tmp_path, fake_feed):
+        """Test that a resume is conditional on the ETag the .part file was started with."""
         downloader = PodcastDownloader(
             feed_url="https://example.com/test.rss",
             output_dir=str(tmp_path),
         )
-        downloader.feed_data = MagicMock()
-        downloader.feed_data.feed.get.return_value = "Test_Podcast"
+        downloader.feed_data = fake_feed("Test_Podcast")
         downloader.create_podcast_directory()
+        downloader.episodes = [{
+            "id": "guid-1",
+            "title": "Episode 1",
+            "links": [{"href": "https://example.com/1.mp3", "type": "audio/mpeg"}],
+        }]
+
+        class Interrupted(io.BytesIO):
+            def read(self, size=-1):
+                data = super().read(3)
+                if not data:
+                    raise OSError("connection reset")
+                return data
+
+        started = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+        started.raw = Interrupted(b"OLD")
+        with patch.object(downloader.session, "get", return_value=started):
+            downloader.download_episodes()
+
+        # The episode was re-encoded: the server ignores the Range and sends all of it
+        changed = MagicMock(status_code=200, headers={"ETag": '"v2"'})
+        changed.raw = io.BytesIO(b"NEW AUDIO")
+        with patch.object(downloader.session, "get", return_value=changed) as get:
+            downloader.download_episodes()
+
+        headers = get.call_args.kwargs["headers"]
+        assert headers["Range"] == "bytes=3-"
+        assert headers["If-Range"] == '"v1"'
+        assert (downloader.podcast_dir / "1_Episode_1.mp3").read_bytes() == b"NEW AUDIO"
+        assert "part_validator" not in downloader.load_downloaded_items()["guid-1"]
+
+    def test_conversion_passes_compression_level_to_ffmpeg(self, tmp_path, fake_feed):
+        """Test that the downloader's compression level reaches the ffmpeg command line."""
+        with patch("podcast_downloader.downloader.check_ffmpeg", return_value=True):
+            downloader = PodcastDownloader(
+                feed_url="https://example.com/test.rss",
+                output_dir=str(tmp_path),
+                convert=True,
+                compression_level=7,
+            )
+        downloader.feed_data = fake_feed("Test_Podcast")
+        downloader.create_podcast_directory()
+        part_path = downloader.podcast_dir / "1_Episode_1.mp3.part"
+        part_path.write_bytes(b"audio")
+
+        def fake_ffmpeg(cmd, **kwargs):
+            Path(cmd[-1]).write_bytes(b"small")
+            return MagicMock(returncode=0)
+
+        with patch("podcast_downloader.downloader.subprocess.run", side_effect=fake_ffmpeg) as run:
+            result = downloader._finish_episode(
+                part_path, downloader.podcast_dir / "1_Episode_1.mp3", 1, "Episode 1"
+            )
+
+        cmd = run.call_args.args[0]
+        assert result == (1, "Episode 1", True, "downloaded")
+        assert cmd[cmd.index("-c:a") + 1] == "libmp3lame"
+        assert cmd[cmd.index("-compression_level") + 1] == "7"
+
+    def test_download_episodes_records_conversion_results(self, tmp_path, fake_feed, capsys):
+        """Test that converted episodes are recorded and counted once conversion finishes."""
+        with patch("podcast_downloader.downloader.check_ffmpeg", return_value=True):
+            downloader = PodcastDownloader(
+                feed_url="https://example.com/test.rss",
+                output_dir=str(tmp_path),
+                convert=True,
+            )
+        downloader.feed_data = fake_feed("Test_Podcast")
+        downloader.create_podcast_directory()
+        downloader.episodes = [
+            {"id": f"guid-{i}", "title": f"Episode {i}",
+             "links": [{"href": f"https://example.com/{i}.mp3", "type": "audio/mpeg"}]}
+            for i in (1, 2)
+        ]
+
+        def fake_get(url, **kwargs):
+            response = MagicMock(status_code=200, headers={"ETag": '"v1"'})
+            response.raw = io.BytesIO(b"audio")
+            return response
+
+        def fake_ffmpeg(cmd, **kwargs):
+            # Episode 2's conversion produces no output, so finishing it fails
+            if Path(cmd[-1]).name.startswith("1_"):
+                Path(cmd[-1]).write_bytes(b"small")
+            return MagicMock(returncode=0)
+
+        with patch.object(downloader.session, "get", side_effect=fake_get), \
+                patch("podcast_downloader.downloader.subprocess.run", side_effect=fake_ffmpeg):
+            assert downloader.download_episodes()
 
         items = downloader.load_downloaded_items()
+        assert items["guid-1"]["filename"] == "1_Episode_1.mp3"
+        # Episode 2 only keeps what the next run needs to resume its .part file
+        assert items["guid-2"] == {
+            "part_url": "https://example.com/2.mp3", "part_validator": '"v1"',
+        }
+        assert items["guid-1"]["etag"] == '"v1"'
+        assert (downloader.podcast_dir / "1_Episode_1.mp3").read_bytes() == b"small"
+        assert "Downloaded: 1, Skipped: 0, Failed: 1" in capsys.readouterr().out
+        assert downloader._convert_pool is None and downloader._conversions == {}
+
+
+class TestTitleShortener:
+    """Test title cleaning and shortening."""
+
+    def test_clean_title_removes_special_chars(self):
+        """Test that punctuation is dropped and whitespace runs become one underscore."""
+        shortener = TitleShortener(27)
 
-        assert items == []
+        cleaned = shortener._clean_title("  Hello,   World! #42 - part_2  ")
+        assert cleaned == "Hello_World_42_-_part_2"
+
+    def test_shorten_plain_title_matches_cleaning(self):
+        """Test that the plain-title fast path gives the same result as full cleaning."""
+        shortener = TitleShortener(255)
+
+        for title in ("Episode 12 - Part 2", "A", "Weird  spacing", " Leading space", "Tab\there"):
+            assert shortener.shorten(title) == shortener._clean_title(title)
+
+    def test_remove_stop_words(self):
+        """Test case-insensitive stop-word removal that keeps a title of only stop words."""
+        shortener = TitleShortener(27)
+
+        shortened = shortener._remove_stop_words("Le_Journal_de_LA_Science_2024")
+        assert shortened == "Journal_Science_2024"
+        assert shortener._remove_stop_words("The_End") == "End"
+        assert shortener._remove_stop_words("of_the") == "of_the"
+
+    def test_clean_title_keeps_unicode_letters_without_unidecode(self):
+        """Test the non-ASCII path when accents can't be transliterated."""
+        shortener = TitleShortener(27)
+
+        with patch("podcast_downloader.downloader.unidecode", None):
+            assert shortener._clean_title("Épisode : l'été") == "Épisode_lété"
 
 
 class TestFilenameGeneration:
     """Test filename generation for chronological ordering."""
 
-    def test_filename_format(self, tmp_path):
+    def test_filename_format(self):
         """Test that filenames have correct format with zero-padded index."""
-        import re
-
         episodes = [
             {"title": "Episode 1", "published": "Mon, 01 Jan 2024"},
             {"title": "Episode 2", "published": "Tue, 02 Jan 2024"},
@@ -114,14 +445,24 @@ class TestFilenameGeneration:
 
         for i, ep in enumerate(episodes, 1):
             title = ep["title"]
-            safe_title = re.sub(r'[\\/:*?"<>|]', "", title)
-            safe_title = re.sub(r"\s+", "_", safe_title).strip()
+            safe_title = sanitize_filename(title)
             index_str = f"{i:03d}"
             filename = f"{index_str}_{safe_title}.mp3"
 
             assert filename.startswith(f"{i:03d}_")
             assert filename.endswith(".mp3")
 
+    def test_index_width(self, shared_tmp):
+        """Test that index width grows with the number of digits in the count."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(shared_tmp),
+        )
+
+        assert [downloader._get_index_width(n) for n in (0, 1, 9, 10, 99, 100, 999, 1000)] == [
+            1, 1, 1, 2, 2, 3, 3, 4,
+        ]
+
     def test_alphabetical_equals_chronological(self):
         """Test that alphabetical sorting equals chronological order."""
         filenames = [
@@ -132,6 +473,128 @@ class TestFilenameGeneration:
             "100_Hundredth_Episode.mp3",
         ]
 
-        sorted_filenames = sorted(filenames)
+        assert all(a <= b for a, b in zip(filenames, filenames[1:]))
+
+
+class TestFeedCache:
+    """Test conditional feed fetching with cached validators."""
+
+    @staticmethod
+    def _response(status_code, headers=None, content=b""):
+        """A streamed session.get() response usable as a context manager."""
+        response = MagicMock(status_code=status_code, url="https://example.com/test.rss")
+        response.headers = headers or {}
+        response.iter_content.return_value = iter([content])
+        response.__enter__.return_value = response
+        return response
+
+    def test_not_modified_feed_reuses_cached_entries(self, tmp_path):
+        """Test that a 304 response restores the entries from the previous run."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+        )
+        fresh = self._response(
+            200,
+            {"ETag": '"abc"', "Content-Type": "application/rss+xml"},
+            b"<rss version='2.0'><channel><title>Test Podcast</title>"
+            b"<item><title>Episode 1</title><guid>guid-1</guid>"
+            b"<enclosure url='https://example.com/1.mp3' type='audio/mpeg'/></item>"
+            b"</channel></rss>",
+        )
+        with patch.object(downloader.session, "get", return_value=fresh):
+            assert downloader.fetch_feed()
+
+        not_modified = self._response(304)
+        with patch.object(downloader.session, "get", return_value=not_modified) as get:
+            assert downloader.fetch_feed()
+
+        assert get.call_args.kwargs["headers"]["If-None-Match"] == '"abc"'
+        assert downloader.feed_data.feed.get("title") == "Test Podcast"
+        assert downloader.feed_data.entries[0].get("title") == "Episode 1"
+
+    def test_not_modified_untitled_feed_keeps_default_name(self, tmp_path):
+        """Test that a cached feed without a channel title still gets the default folder."""
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+        )
+        fresh = self._response(
+            200,
+            {"ETag": '"abc"'},
+            b"<rss version='2.0'><channel><item><title>Episode 1</title><guid>guid-1</guid>"
+            b"</item></channel></rss>",
+        )
+        with patch.object(downloader.session, "get", return_value=fresh):
+            assert downloader.fetch_feed()
+        first_name = downloader.get_podcast_name()
+
+        with patch.object(downloader.session, "get", return_value=self._response(304)):
+            assert downloader.fetch_feed()
+
+        assert downloader.get_podcast_name() == first_name == "podcast"
+
+    def test_cached_entry_keeps_episode_key_without_guid(self, tmp_path):
+        """Test that a guid-less episode is keyed by its link before and after caching."""
+        import feedparser
+
+        downloader = PodcastDownloader(
+            feed_url="https://example.com/test.rss",
+            output_dir=str(tmp_path),
+        )
+        entry = feedparser.FeedParserDict(
+            title="Episode 1",
+            link="https://example.com/episodes/1",
+            links=[{"href": "https://example.com/1.mp3", "type": "audio/mpeg"}],
+        )
+        downloader.feed_data = feedparser.FeedParserDict(
+            feed=feedparser.FeedParserDict(title="Test Podcast"), entries=[entry],
+        )
+
+        downloader._save_feed_cache('"abc"', None)
+        cached = downloader._load_feed_cache()["entries"][0]
+
+        assert episode_key(cached) == episode_key(entry) == "https://example.com/episodes/1"
+
+
+class TestParseRssHead:
+    """Test the incremental RSS reader used for http(s) feeds."""
+
+    def test_stops_after_max_entries(self):
+        """Test that only the first items are read and mapped to feedparser fields."""
+        items = b"".join(
+            b"<item><title>Episode %d</title><guid>guid-%d</guid>"
+            b"<enclosure url='/%d.mp3' type='audio/mpeg' length='1'/></item>" % (i, i, i)
+            for i in range(3, 0, -1)
+        )
+        chunks = iter([
+            b"<rss version='2.0'><channel><title> Test Podcast </title>", items, b"<broken",
+        ])
+
+        feed_data = parse_rss_head(chunks, 2, "https://example.com/feed.rss")
+
+        assert feed_data.feed.title == "Test Podcast"
+        assert [entry.id for entry in feed_data.entries] == ["guid-3", "guid-2"]
+        assert find_audio_enclosure(feed_data.entries[0])["href"] == "https://example.com/3.mp3"
+        assert feed_data.truncated
+        assert next(chunks) == b"<broken"  # never read
+
+    def test_reads_on_to_a_title_after_the_items(self):
+        """Test that a channel title placed after the items is still found."""
+        chunks = iter([
+            b"<rss version='2.0'><channel><item><guid>guid-2</guid></item>",
+            b"<item><guid>guid-1</guid></item><title>Late Title</title></channel></rss>",
+        ])
+
+        feed_data = parse_rss_head(chunks, 1)
+
+        assert feed_data.feed.title == "Late Title"
+        assert [entry.id for entry in feed_data.entries] == ["guid-2"]
+        assert feed_data.truncated
+
+    def test_non_rss_documents_are_left_to_feedparser(self):
+        """Test that Atom feeds and malformed XML return None."""
+        atom = b"<feed xmlns='http://www.w3.org/2005/Atom'><title>T</title></feed>"
 
-        assert filenames == sorted_filenames
+        assert parse_rss_head([atom], 30) is None
+        assert parse_rss_head([b"<rss><channel><title>&nbsp;</title>"], 30) is None